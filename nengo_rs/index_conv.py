@@ -1,3 +1,13 @@
+def _base_meta(base, cache):
+    """Return the elemstrides and shape of *base*, cached by id in *cache*."""
+    if cache is None:
+        return tuple(base.elemstrides), tuple(base.shape)
+    key = id(base)
+    if key not in cache:
+        cache[key] = (tuple(base.elemstrides), tuple(base.shape))
+    return cache[key]
+
+
 def offset_to_multiindex(offset, base_strides):
     multiindex = []
     remainder = offset
@@ -13,13 +23,39 @@ def strides_to_steps(strides, base_strides):
     )
 
 
-def slices_from_signal(signal):
+def slice_bounds_from_signal(signal, base_meta_cache=None):
+    """Return the starts, stops, and steps of *signal* within its base.
+
+    Each is returned as a tuple of ints with one entry per axis. A dict can be
+    passed as *base_meta_cache* to reuse the strides and shape of bases
+    across calls. It is keyed by id, so it must not outlive those bases.
+    """
+    base_strides, base_shape = _base_meta(signal.base, base_meta_cache)
+    starts = offset_to_multiindex(signal.elemoffset, base_strides)
+    steps = strides_to_steps(signal.elemstrides, base_strides)
+    stops = tuple(
+        min(start + step * size, base_size)
+        for start, step, size, base_size in zip(starts, steps, signal.shape, base_shape)
+    )
+    ndim = len(stops)
+    return starts[:ndim], stops, steps[:ndim]
+
+
+def bounds_to_slices(starts, stops, steps):
     return tuple(
-        slice(start, min(start + step * size, base_size), step)
-        for start, size, step, base_size in zip(
-            offset_to_multiindex(signal.elemoffset, signal.base.elemstrides),
-            signal.shape,
-            strides_to_steps(signal.elemstrides, signal.base.elemstrides),
-            signal.base.shape,
-        )
+        slice(start, stop, step) for start, stop, step in zip(starts, stops, steps)
     )
+
+
+def is_identity_view(shape, base_shape, starts, stops, steps):
+    """Whether the slices select all of the base without reordering it."""
+    return (
+        tuple(shape) == tuple(base_shape)
+        and tuple(stops) == tuple(base_shape)
+        and all(start == 0 for start in starts)
+        and all(step == 1 for step in steps)
+    )
+
+
+def slices_from_signal(signal):
+    return bounds_to_slices(*slice_bounds_from_signal(signal))
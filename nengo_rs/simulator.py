@@ -1,14 +1,20 @@
+from collections import deque
+
 from nengo.builder import Model
 from nengo.builder import operator as core_op
 from nengo.builder import neurons
 from nengo.builder import processes
 from nengo.builder.signal import SignalDict
 from nengo.cache import get_default_decoder_cache
-from nengo.utils.graphs import BidirectionalDAG, toposort
+from nengo.exceptions import BuildError
 from nengo.utils.simulator import operator_dependency_graph
 import numpy as np
 
-from .index_conv import slices_from_signal
+from .index_conv import (
+    bounds_to_slices,
+    is_identity_view,
+    slice_bounds_from_signal,
+)
 from .nengo_rs import (
     Engine,
     SignalArrayF64,
@@ -16,6 +22,7 @@ from .nengo_rs import (
     SignalF64,
     SignalU64,
     Reset,
+    ResetBatch,
     TimeUpdate,
     ElementwiseInc,
     Copy,
@@ -27,41 +34,318 @@ from .nengo_rs import (
 )
 
 
+def _returning_float_array(fn, shape):
+    """Wrap *fn* to return its result as a float64 array.
+
+    None and float64 arrays of any shape are passed through unchanged. Any
+    other result is copied into a float64 buffer of the given *shape* that is
+    reused across calls, so no new array is allocated per simulation step.
+    """
+    out = np.empty(shape, dtype=np.float64)
+
+    def wrapped(*args):
+        result = fn(*args)
+        if result is None or (
+            isinstance(result, np.ndarray) and result.dtype == np.float64
+        ):
+            return result
+        np.copyto(out, result)
+        return out
+
+    return wrapped
+
+
+def _make_reset(sim, op, dependencies):
+    return Reset(
+        np.asarray(op.value, dtype=np.float64),
+        sim.get_sig(op.dst),
+        dependencies,
+    )
+
+
+def _make_reset_batch(sim, resets, dependencies):
+    return ResetBatch(
+        np.asarray(resets[0].value, dtype=np.float64),
+        [sim.get_sig(op.dst) for op in resets],
+        dependencies,
+    )
+
+
+def _make_time_update(sim, op, dependencies):
+    return TimeUpdate(
+        sim.dt,
+        sim.get_sig(sim.model.step),
+        sim.get_sig(sim.model.time),
+        dependencies,
+    )
+
+
+def _make_elementwise_inc(sim, op, dependencies):
+    return ElementwiseInc(
+        sim.get_sig(op.Y),
+        sim.get_sig(op.A),
+        sim.get_sig(op.X),
+        dependencies,
+    )
+
+
+def _make_copy(sim, op, dependencies):
+    assert op.src_slice is None and op.dst_slice is None
+    return Copy(
+        op.inc,
+        sim.get_sig(op.src),
+        sim.get_sig(op.dst),
+        dependencies,
+    )
+
+
+def _make_dot_inc(sim, op, dependencies):
+    return DotInc(
+        sim.get_sig(op.Y),
+        sim.get_sig(op.A),
+        sim.get_sig(op.X),
+        dependencies,
+    )
+
+
+def _make_sim_neurons(sim, op, dependencies):
+    signals = sim._signals
+    states = getattr(op, "states", [])
+    if states:
+        op.init_signals(signals)
+    return SimNeurons(
+        sim.dt,
+        op.neurons.step_math,
+        [signals[s] for s in states],
+        sim.get_sig(op.J),
+        sim.get_sig(op.output),
+        dependencies,
+    )
+
+
+def _make_sim_process(sim, op, dependencies):
+    signals = sim._signals
+    if op.state:
+        op.init_signals(signals)
+    shape_in = (0,) if op.input is None else op.input.shape
+    shape_out = op.output.shape
+    rng = None
+    state = {k: signals[s] for k, s in op.state.items()}
+    step_fn = op.process.make_step(shape_in, shape_out, sim.dt, rng, state)
+    return SimProcess(
+        op.mode == "inc",
+        _returning_float_array(step_fn, shape_out),
+        sim.get_sig(op.t),
+        sim.get_sig(op.output),
+        None if op.input is None else sim.get_sig(op.input),
+        dependencies,
+    )
+
+
+def _make_sim_py_func(sim, op, dependencies):
+    return SimPyFunc(
+        _returning_float_array(op.fn, op.output.shape),
+        sim.get_sig(op.output),
+        None if op.t is None else sim.get_sig(op.t),
+        None if op.x is None else sim.get_sig(op.x),
+        dependencies,
+    )
+
+
+HANDLERS = {
+    core_op.Reset: _make_reset,
+    core_op.TimeUpdate: _make_time_update,
+    core_op.ElementwiseInc: _make_elementwise_inc,
+    core_op.Copy: _make_copy,
+    core_op.DotInc: _make_dot_inc,
+    neurons.SimNeurons: _make_sim_neurons,
+    processes.SimProcess: _make_sim_process,
+    core_op.SimPyFunc: _make_sim_py_func,
+}
+
+
+# Attributes holding the signals that each handler looks up with get_sig.
+# Signals that only live in the SignalDict, such as process states, are not
+# listed, so no engine signal is created for them.
+ENGINE_SIGNALS = {
+    _make_reset: ("dst",),
+    _make_time_update: (),
+    _make_elementwise_inc: ("Y", "A", "X"),
+    _make_copy: ("src", "dst"),
+    _make_dot_inc: ("Y", "A", "X"),
+    _make_sim_neurons: ("J", "output"),
+    _make_sim_process: ("t", "output", "input"),
+    _make_sim_py_func: ("output", "t", "x"),
+}
+
+
+def get_handler(op):
+    """Return the function translating *op* into the Rust operator.
+
+    Subclasses of the supported operators are resolved through their MRO
+    once and then cached in `HANDLERS`.
+    """
+    op_type = type(op)
+    if op_type not in HANDLERS:
+        for base in op_type.__mro__[1:]:
+            if base in HANDLERS:
+                HANDLERS[op_type] = HANDLERS[base]
+                break
+        else:
+            raise Exception(f"missing: {op}")
+    return HANDLERS[op_type]
+
+
+def toposort(forward_adj):
+    """Topologically sort a graph given as successor lists of node indices.
+
+    Returns the node indices in an order in which every node comes after
+    all of its predecessors, and the predecessor lists of all nodes.
+    """
+    indegree = [0] * len(forward_adj)
+    for successors in forward_adj:
+        for j in successors:
+            indegree[j] += 1
+
+    queue = deque(i for i, n in enumerate(indegree) if n == 0)
+    order = []
+    predecessors = [[] for _ in forward_adj]
+    while queue:
+        i = queue.popleft()
+        order.append(i)
+        for j in forward_adj[i]:
+            predecessors[j].append(i)
+            indegree[j] -= 1
+            if indegree[j] == 0:
+                queue.append(j)
+
+    if len(order) < len(forward_adj):
+        raise BuildError("Cycles in the operator dependency graph.")
+    return order, predecessors
+
+
+def schedule_operators(operators):
+    """Order *operators* for the engine and merge independent resets.
+
+    Returns one ``(ops, dependencies)`` entry per engine operator in execution
+    order. *ops* is the list of nengo operators translated into that engine
+    operator. It only has more than one element for resets without
+    dependencies that assign the same value. These are merged across signals,
+    because a reset always runs before everything that touches its target.
+    *dependencies* holds the indices of the entries that must run first.
+    """
+    dg = operator_dependency_graph(operators)
+    nodes = list(dg)
+    op_ids = {op: i for i, op in enumerate(nodes)}
+    forward_adj = [[op_ids[node] for node in dg[op]] for op in nodes]
+    order, predecessors = toposort(forward_adj)
+
+    schedule = [None] * len(order)
+    indices = [0] * len(order)
+    n_scheduled = 0
+    reset_batches = {}
+    for i in order:
+        op = nodes[i]
+        if get_handler(op) is _make_reset and not predecessors[i]:
+            if op.value not in reset_batches:
+                reset_batches[op.value] = n_scheduled
+                schedule[n_scheduled] = ([], np.empty(0, dtype=np.int64))
+                n_scheduled += 1
+            indices[i] = reset_batches[op.value]
+            schedule[indices[i]][0].append(op)
+            continue
+
+        dependencies = {indices[j] for j in predecessors[i]}
+        schedule[n_scheduled] = (
+            [op],
+            np.fromiter(dependencies, dtype=np.int64, count=len(dependencies)),
+        )
+        indices[i] = n_scheduled
+        n_scheduled += 1
+    del schedule[n_scheduled:]
+    return schedule
+
+
 class Simulator:
     def add_sig(self, signal_to_engine_id, signal):
         if signal is None or signal in signal_to_engine_id:
-            pass
-        elif signal.base is None or signal is signal.base:
-            signal_to_engine_id[signal] = SignalArrayF64(signal)
+            return
+        if signal.base is None or signal is signal.base:
+            signal_to_engine_id[signal] = None
+            self._pending_bases.append(signal)
+            return
+
+        # _resolve_view walks up to the root base, so the base itself
+        # never needs to be resolved as a view.
+        base, starts, stops, steps = self._resolve_view(signal)
+        if base not in signal_to_engine_id:
+            signal_to_engine_id[base] = None
+            self._pending_bases.append(base)
+        signal_to_engine_id[signal] = None
+        if is_identity_view(signal.shape, base.shape, starts, stops, steps):
+            self._pending_aliases.append((signal, base))
         else:
-            current = signal
-            sliceinfo = slices_from_signal(signal)
-            while (
-                current.base.base is not None and current.base.base is not current.base
-            ):
-                current = current.base
-                sliceinfo = tuple(
-                    slice(
-                        b.start + b.step * a.start,
-                        b.start + b.step * a.stop,
-                        a.step * b.step,
-                    )
-                    for a, b in zip(sliceinfo, slices_from_signal(current))
-                )
-            self.add_sig(signal_to_engine_id, current.base)
-            try:
-                signal_to_engine_id[signal] = SignalArrayViewF64(
-                    signal.name, sliceinfo, signal_to_engine_id[current.base]
+            self._pending_views.append(
+                (signal, bounds_to_slices(starts, stops, steps), base)
+            )
+
+    def flush_sigs(self, signal_to_engine_id):
+        if self._pending_bases:
+            signals = self._pending_bases
+            self._pending_bases = []
+            signal_to_engine_id.update(
+                zip(
+                    signals,
+                    SignalArrayF64.bulk(
+                        [signal.name for signal in signals],
+                        [
+                            np.asarray(signal.initial_value, dtype=np.float64)
+                            for signal in signals
+                        ],
+                    ),
                 )
-            except TypeError:
-                print(
-                    f"TypeError: {signal.name} {sliceinfo} {current.base} {signal_to_engine_id[current.base]}"
+            )
+        if self._pending_aliases:
+            for signal, base in self._pending_aliases:
+                signal_to_engine_id[signal] = signal_to_engine_id[base]
+            self._pending_aliases = []
+        if self._pending_views:
+            signals, sliceinfos, bases = zip(*self._pending_views)
+            self._pending_views = []
+            signal_to_engine_id.update(
+                zip(
+                    signals,
+                    SignalArrayViewF64.bulk(
+                        [signal.name for signal in signals],
+                        list(sliceinfos),
+                        [signal_to_engine_id[base] for base in bases],
+                    ),
                 )
-                raise
+            )
 
-    def get_sig(self, signal_to_engine_id, signal):
-        self.add_sig(signal_to_engine_id, signal)
-        return signal_to_engine_id[signal]
+    def _resolve_view(self, signal):
+        starts, stops, steps = self._slice_bounds_from_signal(signal)
+        current = signal
+        while current.base.base is not None and current.base.base is not current.base:
+            current = current.base
+            base_starts, _, base_steps = self._slice_bounds_from_signal(current)
+            starts = tuple(
+                b + s * i for b, s, i in zip(base_starts, base_steps, starts)
+            )
+            stops = tuple(b + s * i for b, s, i in zip(base_starts, base_steps, stops))
+            steps = tuple(s * i for s, i in zip(base_steps, steps))
+        return current.base, starts, stops, steps
+
+    def _slice_bounds_from_signal(self, signal):
+        key = id(signal)
+        if key not in self._slice_cache:
+            self._slice_cache[key] = slice_bounds_from_signal(
+                signal, self._base_meta_cache
+            )
+        return self._slice_cache[key]
+
+    def get_sig(self, signal):
+        return self._sig_to_ngine_id[signal]
 
     def __init__(self, network, dt=0.001, seed=None):
         self.model = Model(
@@ -71,120 +355,37 @@ class Simulator:
         )
         self.model.build(network)
 
-        signal_to_engine_id = {}
-        for signal_dict in self.model.sig.values():
-            for signal in signal_dict.values():
-                self.add_sig(signal_to_engine_id, signal)
-        x = SignalU64("step", 0)
-        signal_to_engine_id[self.model.step] = x
-        signal_to_engine_id[self.model.time] = SignalF64("time", 0.0)
+        self._slice_cache = {}
+        self._base_meta_cache = {}
+        self._signals = SignalDict()
+        self._pending_bases = []
+        self._pending_aliases = []
+        self._pending_views = []
+        signal_to_engine_id = {
+            self.model.step: SignalU64("step", 0),
+            self.model.time: SignalF64("time", 0.0),
+        }
+        # Register all signals looked up by the operators and probes before
+        # flushing once, so that the bases and views are each created in a
+        # single bulk call.
+        for op in self.model.operators:
+            for name in ENGINE_SIGNALS[get_handler(op)]:
+                self.add_sig(signal_to_engine_id, getattr(op, name))
+        for probe in self.model.probes:
+            self.add_sig(signal_to_engine_id, self.model.sig[probe]["in"])
+        self.flush_sigs(signal_to_engine_id)
+        del self._pending_bases, self._pending_aliases, self._pending_views
+        del self._slice_cache, self._base_meta_cache
         self._sig_to_ngine_id = signal_to_engine_id
 
-        dg = BidirectionalDAG(operator_dependency_graph(self.model.operators))
-        toposorted_dg = toposort(dg.forward)
-        node_indices = {node: idx for idx, node in enumerate(toposorted_dg)}
-
-        ops = []
-        for op in toposorted_dg:
-            dependencies = [node_indices[node] for node in dg.backward[op]]
-            if isinstance(op, core_op.Reset):
-                ops.append(
-                    Reset(
-                        np.asarray(op.value, dtype=np.float64),
-                        self.get_sig(signal_to_engine_id, op.dst),
-                        dependencies,
-                    )
-                )
-            elif isinstance(op, core_op.TimeUpdate):
-                ops.append(
-                    TimeUpdate(
-                        dt,
-                        self.get_sig(signal_to_engine_id, self.model.step),
-                        self.get_sig(signal_to_engine_id, self.model.time),
-                        dependencies,
-                    )
-                )
-            elif isinstance(op, core_op.ElementwiseInc):
-                ops.append(
-                    ElementwiseInc(
-                        self.get_sig(signal_to_engine_id, op.Y),
-                        self.get_sig(signal_to_engine_id, op.A),
-                        self.get_sig(signal_to_engine_id, op.X),
-                        dependencies,
-                    )
-                )
-            elif isinstance(op, core_op.Copy):
-                assert op.src_slice is None and op.dst_slice is None
-                ops.append(
-                    Copy(
-                        op.inc,
-                        self.get_sig(signal_to_engine_id, op.src),
-                        self.get_sig(signal_to_engine_id, op.dst),
-                        dependencies,
-                    )
-                )
-            elif isinstance(op, core_op.DotInc):
-                ops.append(
-                    DotInc(
-                        self.get_sig(signal_to_engine_id, op.Y),
-                        self.get_sig(signal_to_engine_id, op.A),
-                        self.get_sig(signal_to_engine_id, op.X),
-                        dependencies,
-                    )
-                )
-            elif isinstance(op, neurons.SimNeurons):
-                signals = SignalDict()
-                op.init_signals(signals)
-                ops.append(
-                    SimNeurons(
-                        self.dt,
-                        op.neurons.step_math,
-                        [signals[s] for s in op.states]
-                        if hasattr(op, "states")
-                        else [],
-                        self.get_sig(signal_to_engine_id, op.J),
-                        self.get_sig(signal_to_engine_id, op.output),
-                        dependencies,
-                    )
-                )
-            elif isinstance(op, processes.SimProcess):
-                signals = SignalDict()
-                op.init_signals(signals)
-                shape_in = (0,) if op.input is None else op.input.shape
-                shape_out = op.output.shape
-                rng = None
-                state = {k: signals[s] for k, s in op.state.items()}
-                step_fn = op.process.make_step(shape_in, shape_out, self.dt, rng, state)
-                ops.append(
-                    SimProcess(
-                        op.mode == "inc",
-                        lambda *args, step_fn=step_fn: np.asarray(
-                            step_fn(*args), dtype=float
-                        ),
-                        self.get_sig(signal_to_engine_id, op.t),
-                        self.get_sig(signal_to_engine_id, op.output),
-                        None
-                        if op.input is None
-                        else self.get_sig(signal_to_engine_id, op.input),
-                        dependencies,
-                    )
-                )
-            elif isinstance(op, core_op.SimPyFunc):
-                ops.append(
-                    SimPyFunc(
-                        lambda *args, op=op: np.asarray(op.fn(*args), dtype=float),
-                        self.get_sig(signal_to_engine_id, op.output),
-                        None
-                        if op.t is None
-                        else self.get_sig(signal_to_engine_id, op.t),
-                        None
-                        if op.x is None
-                        else self.get_sig(signal_to_engine_id, op.x),
-                        dependencies,
-                    )
-                )
+        schedule = schedule_operators(self.model.operators)
+        ops = [None] * len(schedule)
+        for i, (group, dependencies) in enumerate(schedule):
+            if len(group) > 1:
+                ops[i] = _make_reset_batch(self, group, dependencies)
             else:
-                raise Exception(f"missing: {op}")
+                ops[i] = get_handler(group[0])(self, group[0], dependencies)
+        del self._signals
 
         self.probe_mapping = {}
         for probe in self.model.probes:
@@ -192,11 +393,11 @@ class Simulator:
                 signal_to_engine_id[self.model.sig[probe]["in"]]
             )
 
-        self._engine = Engine(
-            list(signal_to_engine_id.values()), ops, list(self.probe_mapping.values())
-        )
+        # Identity views share the handle of their base.
+        engine_signals = list({id(s): s for s in signal_to_engine_id.values()}.values())
+        self._engine = Engine(engine_signals, ops, list(self.probe_mapping.values()))
         self.data = SimData(self)
-        print("initialized")
+        self._trange_cache = (0, np.empty(0))
 
         self._engine.reset()
 
@@ -214,16 +415,30 @@ class Simulator:
         return self.model.dt
 
     def run(self, time_in_seconds):
-        print("run")
-        n_steps = int(time_in_seconds / self.dt)
-        self._engine.run_steps(n_steps)
+        self.run_steps(int(time_in_seconds / self.dt))
+
+    def run_steps(self, steps):
+        self._engine.run_steps(steps)
 
     def run_step(self):
         self._engine.run_step()
 
     def trange(self):
         step = self._sig_to_ngine_id[self.model.step].get()
-        return np.arange(1, step + 1) * self.dt
+        cached_step, cached = self._trange_cache
+        if step <= cached_step:
+            return cached[:step].copy()
+
+        trange = np.empty(step)
+        trange[:cached_step] = cached
+        np.multiply(
+            np.arange(cached_step + 1, step + 1, dtype=np.float64),
+            self.dt,
+            out=trange[cached_step:],
+        )
+        trange.flags.writeable = False
+        self._trange_cache = (step, trange)
+        return trange.copy()
 
 
 class SimData:
@@ -14,3 +14,40 @@ def test_dev():
 
     assert np.allclose(sim.trange(), np.arange(0.0, 1.0, dt) + dt)
     assert np.allclose(sim.data[probe], 0.5)
+
+
+def test_trange_across_runs():
+    with nengo.Network() as model:
+        nengo.Node(0.5)
+
+    dt = 0.001
+    with nengo_rs.Simulator(model, dt=dt) as sim:
+        sim.run(0.5)
+        assert np.allclose(sim.trange(), np.arange(0.0, 0.5, dt) + dt)
+        sim.run(0.5)
+        assert np.allclose(sim.trange(), np.arange(0.0, 1.0, dt) + dt)
+
+
+def test_trange_returns_independent_arrays():
+    with nengo.Network() as model:
+        nengo.Node(0.5)
+
+    dt = 0.001
+    with nengo_rs.Simulator(model, dt=dt) as sim:
+        sim.run_steps(100)
+        trange = sim.trange()
+        trange[:] = 0.0
+        assert np.allclose(sim.trange(), np.arange(1, 101) * dt)
+        assert sim.trange() is not sim.trange()
+
+
+def test_run_steps():
+    with nengo.Network() as model:
+        node = nengo.Node(0.5)
+        probe = nengo.Probe(node)
+
+    with nengo_rs.Simulator(model) as sim:
+        sim.run_steps(10)
+
+    assert sim.data[probe].shape == (10, 1)
+    assert np.allclose(sim.data[probe], 0.5)
@@ -1,6 +1,8 @@
 from nengo.builder.signal import Signal
 from nengo_rs.index_conv import (
+    is_identity_view,
     offset_to_multiindex,
+    slice_bounds_from_signal,
     slices_from_signal,
     strides_to_steps,
 )
@@ -30,3 +32,28 @@ def test_slices_from_signal():
         slice(0, 5, 1),
         slice(4, 20, 1),
     )
+
+
+def test_slice_bounds_from_signal():
+    base = Signal(initial_value=np.zeros((20, 20, 20)))
+    starts, stops, steps = slice_bounds_from_signal(base[:, 2:10:3, ::4])
+    assert starts == (0, 2, 0)
+    assert stops == (20, 11, 20)
+    assert steps == (1, 3, 4)
+
+
+def test_is_identity_view():
+    base = Signal(initial_value=np.zeros((4, 5)))
+    views = [(base[:, :], True), (base[:, :4], False), (base[::2], False)]
+    for view, expected in views:
+        bounds = slice_bounds_from_signal(view)
+        assert is_identity_view(view.shape, base.shape, *bounds) == expected
+
+
+def test_slice_bounds_from_signal_with_base_meta_cache():
+    base = Signal(initial_value=np.zeros((20, 20, 20)))
+    view = base[:, 2:10:3, ::4]
+    cache = {}
+    assert slice_bounds_from_signal(view, cache) == slice_bounds_from_signal(view)
+    assert slice_bounds_from_signal(view, cache) == slice_bounds_from_signal(view)
+    assert list(cache) == [id(base)]
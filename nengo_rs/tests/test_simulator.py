@@ -0,0 +1,89 @@
+import nengo
+from nengo.builder import Model
+from nengo.builder import operator as core_op
+from nengo.builder.signal import Signal
+from nengo.exceptions import BuildError
+from nengo.utils.simulator import operator_dependency_graph
+from nengo_rs.simulator import _returning_float_array, schedule_operators, toposort
+import numpy as np
+import pytest
+
+
+def test_toposort():
+    forward_adj = [[2], [0, 2], [], [1]]
+    order, predecessors = toposort(forward_adj)
+    assert sorted(order) == [0, 1, 2, 3]
+    for i, successors in enumerate(forward_adj):
+        for j in successors:
+            assert order.index(i) < order.index(j)
+    assert [sorted(p) for p in predecessors] == [[1], [3], [0, 1], []]
+
+
+def test_toposort_raises_on_cycles():
+    with pytest.raises(BuildError):
+        toposort([[1], [0]])
+
+
+def test_schedule_operators_merges_resets_of_the_same_value():
+    base = Signal(initial_value=np.zeros(4), name="base")
+    other = Signal(initial_value=np.zeros(2), name="other")
+    target = Signal(initial_value=np.zeros(2), name="target")
+    left, right = base[:2], base[2:]
+    resets = [core_op.Reset(left), core_op.Reset(right), core_op.Reset(other)]
+    one_reset = core_op.Reset(Signal(initial_value=np.zeros(2)), value=1.0)
+    inc = core_op.ElementwiseInc(left, right, target)
+
+    schedule = schedule_operators([resets[0], inc, one_reset, resets[1], resets[2]])
+    groups = [group for group, _ in schedule]
+    assert len(schedule) == 3
+    assert [one_reset] in groups
+
+    batch_index = next(i for i, group in enumerate(groups) if resets[0] in group)
+    assert set(groups[batch_index]) == set(resets)
+
+    inc_index = groups.index([inc])
+    assert inc_index > batch_index
+    assert schedule[inc_index][1].tolist() == [batch_index]
+
+
+def test_schedule_operators_merges_resets_of_a_built_network():
+    with nengo.Network(seed=0) as network:
+        stim = nengo.Node([0.5, -0.5])
+        ensembles = nengo.networks.EnsembleArray(20, n_ensembles=2)
+        nengo.Connection(stim, ensembles.input)
+        nengo.Probe(ensembles.output, synapse=0.01)
+    model = Model()
+    model.build(network)
+
+    schedule = schedule_operators(model.operators)
+    batches = [(i, group) for i, (group, _) in enumerate(schedule) if len(group) > 1]
+    assert batches
+    assert all(isinstance(op, core_op.Reset) for _, group in batches for op in group)
+    n_merged = sum(len(group) - 1 for _, group in batches)
+    assert len(schedule) == len(model.operators) - n_merged
+
+    index = {op: i for i, (group, _) in enumerate(schedule) for op in group}
+    dg = operator_dependency_graph(model.operators)
+    for batch_index, group in batches:
+        for reset in group:
+            for successor in dg[reset]:
+                assert batch_index in schedule[index[successor]][1].tolist()
+
+
+def test_returning_float_array_passes_through_none_and_float64_arrays():
+    result = np.zeros((2, 3))
+    assert _returning_float_array(lambda: result, (2,))() is result
+    assert _returning_float_array(lambda: None, (2,))() is None
+
+
+def test_returning_float_array_copies_other_results_into_a_buffer():
+    results = iter([[1, 2], np.array([3.0, 4.0], dtype=np.float32), 5])
+    wrapped = _returning_float_array(lambda: next(results), (2,))
+
+    out = wrapped()
+    assert out.dtype == np.float64
+    assert out.tolist() == [1.0, 2.0]
+    assert wrapped() is out
+    assert out.tolist() == [3.0, 4.0]
+    assert wrapped() is out
+    assert out.tolist() == [5.0, 5.0]
@@ -4,9 +4,11 @@ use crate::operator;
 use crate::operator::OperatorNode;
 use crate::signal::ArraySignal;
 use ndarray::ArrayD;
-use numpy::PyArrayDyn;
+use numpy::{PyArray1, PyArrayDyn};
+use pyo3::exceptions as exc;
 use pyo3::prelude::*;
 use pyo3::types::PyList;
+use std::convert::TryFrom;
 use std::marker::PhantomData;
 use std::sync::Arc;
 
@@ -41,7 +43,7 @@ macro_rules! bind_op {
                 $($(
                     $optsig : Option<&PySignal>,
                 )*)?
-                dependencies: Vec<usize>,
+                dependencies: &PyArray1<i64>,
             ) -> PyResult<(Self, PyOperator)> {
                 Ok((
                     Self {},
@@ -59,7 +61,19 @@ macro_rules! bind_op {
                                 )*)?
                                 $($fname: $expr,)*
                             }),
-                            dependencies,
+                            dependencies: dependencies
+                                .readonly()
+                                .as_array()
+                                .iter()
+                                .map(|&i| {
+                                    usize::try_from(i).map_err(|_| {
+                                        PyErr::new::<exc::ValueError, _>(format!(
+                                            "Invalid dependency index {}.",
+                                            i
+                                        ))
+                                    })
+                                })
+                                .collect::<PyResult<_>>()?,
                         }),
                     },
                 ))
@@ -80,6 +94,24 @@ bind_op!(
     {value: value.extract::<&PyArrayDyn<f64>>()?.to_owned_array()}
 );
 
+#[pyclass(extends=PyOperator, name=ResetBatch)]
+pub struct PyResetBatch {}
+
+bind_op!(
+    PyResetBatch: ResetBatch<ArrayD<f64>, ArraySignal<f64>>,
+    {
+        args: (value: &PyAny, targets: &PyAny),
+    },
+    {
+        value: value.extract::<&PyArrayDyn<f64>>()?.to_owned_array(),
+        targets: targets
+            .extract::<Vec<&PyCell<PySignal>>>()?
+            .iter()
+            .map(|target| target.borrow().extract_signal("targets"))
+            .collect::<PyResult<_>>()?
+    }
+);
+
 #[pyclass(extends=PyOperator, name=TimeUpdate)]
 pub struct PyTimeUpdate {}
 
@@ -119,7 +151,13 @@ pub struct PyDotInc {}
 bind_op!(
     PyDotInc: DotInc<f64>,
     {signals: [target, left, right],},
-    {}
+    {
+        kernel: operator::DotIncKernel::for_shapes(
+            target.get().shape(),
+            left.get().shape(),
+            right.get().shape()
+        )
+    }
 );
 
 #[pyclass(extends=PyOperator, name=SimNeurons)]
@@ -180,6 +218,7 @@ mod tests {
         m.add_class::<PyDotInc>()?;
         m.add_class::<PyElementwiseInc>()?;
         m.add_class::<PyReset>()?;
+        m.add_class::<PyResetBatch>()?;
         m.add_class::<PySimNeurons>()?;
         m.add_class::<PySimProcess>()?;
         m.add_class::<PySimPyFunc>()?;
@@ -217,7 +256,7 @@ mod tests {
     #[test]
     fn can_instantiate_copy() {
         can_instantiate(&format!(
-            "o.Copy(False, {}, {}, [0])",
+            "o.Copy(False, {}, {}, np.array([0], dtype=np.int64))",
             DUMMY_SIGNAL_CONSTRUCTOR, DUMMY_SIGNAL_CONSTRUCTOR
         ))
         .unwrap();
@@ -226,7 +265,7 @@ mod tests {
     #[test]
     fn can_instantiate_dot_inc() {
         can_instantiate(&format!(
-            "o.DotInc({}, {}, {}, [0])",
+            "o.DotInc({}, {}, {}, np.array([0], dtype=np.int64))",
             DUMMY_SIGNAL_CONSTRUCTOR, DUMMY_SIGNAL_CONSTRUCTOR, DUMMY_SIGNAL_CONSTRUCTOR
         ))
         .unwrap();
@@ -235,7 +274,7 @@ mod tests {
     #[test]
     fn can_instantiate_elementwise_inc() {
         can_instantiate(&format!(
-            "o.ElementwiseInc({}, {}, {}, [0])",
+            "o.ElementwiseInc({}, {}, {}, np.array([0], dtype=np.int64))",
             DUMMY_SIGNAL_CONSTRUCTOR, DUMMY_SIGNAL_CONSTRUCTOR, DUMMY_SIGNAL_CONSTRUCTOR
         ))
         .unwrap();
@@ -244,16 +283,25 @@ mod tests {
     #[test]
     fn can_instantiate_reset() {
         can_instantiate(&format!(
-            "o.Reset(np.zeros(1), {}, [0])",
+            "o.Reset(np.zeros(1), {}, np.array([0], dtype=np.int64))",
             DUMMY_SIGNAL_CONSTRUCTOR
         ))
         .unwrap();
     }
 
+    #[test]
+    fn can_instantiate_reset_batch() {
+        can_instantiate(&format!(
+            "o.ResetBatch(np.zeros(1), [{}, {}], np.array([0], dtype=np.int64))",
+            DUMMY_SIGNAL_CONSTRUCTOR, DUMMY_SIGNAL_CONSTRUCTOR
+        ))
+        .unwrap();
+    }
+
     #[test]
     fn can_instantiate_sim_neurons() {
         can_instantiate(&format!(
-            "o.SimNeurons(0.001, lambda dt, J, output: None, [], {}, {}, [0])",
+            "o.SimNeurons(0.001, lambda dt, J, output: None, [], {}, {}, np.array([0], dtype=np.int64))",
             DUMMY_SIGNAL_CONSTRUCTOR, DUMMY_SIGNAL_CONSTRUCTOR
         ))
         .unwrap();
@@ -262,7 +310,7 @@ mod tests {
     #[test]
     fn can_instantiate_sim_process() {
         can_instantiate(&format!(
-            "o.SimProcess(False, lambda t, input: None, o.SignalF64('time', 0.), {}, {}, [0])",
+            "o.SimProcess(False, lambda t, input: None, o.SignalF64('time', 0.), {}, {}, np.array([0], dtype=np.int64))",
             DUMMY_SIGNAL_CONSTRUCTOR, DUMMY_SIGNAL_CONSTRUCTOR
         ))
         .unwrap();
@@ -271,7 +319,7 @@ mod tests {
     #[test]
     fn can_instantiate_sim_process_without_optional_signals() {
         can_instantiate(&format!(
-            "o.SimProcess(False, lambda t: None, o.SignalF64('time', 0.), {}, None, [0])",
+            "o.SimProcess(False, lambda t: None, o.SignalF64('time', 0.), {}, None, np.array([0], dtype=np.int64))",
             DUMMY_SIGNAL_CONSTRUCTOR
         ))
         .unwrap();
@@ -280,7 +328,7 @@ mod tests {
     #[test]
     fn can_instantiate_sim_py_func() {
         can_instantiate(&format!(
-            "o.SimPyFunc(lambda t, x: None, {}, o.SignalF64('time', 0.), {}, [0])",
+            "o.SimPyFunc(lambda t, x: None, {}, o.SignalF64('time', 0.), {}, np.array([0], dtype=np.int64))",
             DUMMY_SIGNAL_CONSTRUCTOR, DUMMY_SIGNAL_CONSTRUCTOR,
         ))
         .unwrap();
@@ -289,7 +337,7 @@ mod tests {
     #[test]
     fn can_instantiate_sim_py_func_without_optional_signals() {
         can_instantiate(&format!(
-            "o.SimPyFunc(lambda t, x: None, {}, None, None, [0])",
+            "o.SimPyFunc(lambda t, x: None, {}, None, None, np.array([0], dtype=np.int64))",
             DUMMY_SIGNAL_CONSTRUCTOR,
         ))
         .unwrap();
@@ -298,8 +346,17 @@ mod tests {
     #[test]
     fn can_instantiate_time_update() {
         can_instantiate(
-            "o.TimeUpdate(0.001, o.SignalU64('step', 0), o.SignalF64('time', 0.), [0])",
+            "o.TimeUpdate(0.001, o.SignalU64('step', 0), o.SignalF64('time', 0.), np.array([0], dtype=np.int64))",
         )
         .unwrap();
     }
+
+    #[test]
+    fn cannot_instantiate_with_negative_dependency() {
+        assert!(can_instantiate(&format!(
+            "o.Copy(False, {}, {}, np.array([-1], dtype=np.int64))",
+            DUMMY_SIGNAL_CONSTRUCTOR, DUMMY_SIGNAL_CONSTRUCTOR
+        ))
+        .is_err());
+    }
 }
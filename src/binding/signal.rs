@@ -45,9 +45,28 @@ impl PySignalArrayF64 {
     fn new(signal: &PyAny) -> PyResult<(Self, PySignal)> {
         let name = signal.getattr("name")?.extract()?;
         let initial_value = signal.getattr("initial_value")?;
-        let initial_value: &PyArrayDyn<f64> = initial_value.extract()?;
+        Ok(Self::from_initial_value(name, initial_value.extract()?))
+    }
+
+    #[staticmethod]
+    fn bulk(
+        py: Python,
+        names: Vec<String>,
+        initial_values: Vec<&PyArrayDyn<f64>>,
+    ) -> PyResult<Vec<Py<Self>>> {
+        check_bulk_len("initial_values", names.len(), initial_values.len())?;
+        names
+            .into_iter()
+            .zip(initial_values)
+            .map(|(name, initial_value)| Py::new(py, Self::from_initial_value(name, initial_value)))
+            .collect()
+    }
+}
+
+impl PySignalArrayF64 {
+    fn from_initial_value(name: String, initial_value: &PyArrayDyn<f64>) -> (Self, PySignal) {
         let signal = Arc::new(ArraySignal::new(name, initial_value));
-        Ok((Self {}, PySignal { signal }))
+        (Self {}, PySignal { signal })
     }
 }
 
@@ -62,7 +81,35 @@ impl PySignalArrayViewF64 {
         slice_info: &PyAny,
         base: &PyCell<PySignal>,
     ) -> PyResult<(Self, PySignal)> {
-        let base: &PyCell<PySignal> = base.extract().unwrap();
+        Self::from_slice_info(name, slice_info, base)
+    }
+
+    #[staticmethod]
+    fn bulk(
+        py: Python,
+        names: Vec<String>,
+        slice_infos: Vec<&PyAny>,
+        bases: Vec<&PyCell<PySignal>>,
+    ) -> PyResult<Vec<Py<Self>>> {
+        check_bulk_len("slice_infos", names.len(), slice_infos.len())?;
+        check_bulk_len("bases", names.len(), bases.len())?;
+        names
+            .into_iter()
+            .zip(slice_infos)
+            .zip(bases)
+            .map(|((name, slice_info), base)| {
+                Py::new(py, Self::from_slice_info(name, slice_info, base)?)
+            })
+            .collect()
+    }
+}
+
+impl PySignalArrayViewF64 {
+    fn from_slice_info(
+        name: String,
+        slice_info: &PyAny,
+        base: &PyCell<PySignal>,
+    ) -> PyResult<(Self, PySignal)> {
         let base: Arc<ArraySignal<f64>> = base.borrow().extract_signal("base")?;
 
         let slice_info: Vec<&PySlice> = slice_info.extract()?;
@@ -87,6 +134,17 @@ impl PySignalArrayViewF64 {
     }
 }
 
+fn check_bulk_len(name: &str, expected: usize, actual: usize) -> PyResult<()> {
+    if expected == actual {
+        Ok(())
+    } else {
+        Err(PyErr::new::<exc::ValueError, _>(format!(
+            "`{}` must have the same length as `names` ({} != {}).",
+            name, actual, expected
+        )))
+    }
+}
+
 #[pyclass(extends=PySignal, name=SignalU64)]
 pub struct PySignalU64 {}
 
@@ -212,6 +270,16 @@ mod tests {
         );
     }
 
+    #[test]
+    fn test_py_signal_array_f64_bulk() {
+        test_binding::<_, ArraySignal<f64>>(
+            "s.SignalArrayF64.bulk(['A', 'TestSignal'], [np.zeros(1), np.array([1., 2.])])[1]",
+            "TestSignal",
+            &[2],
+            ArrayRef::Owned(array![1., 2.].into_dimensionality::<IxDyn>().unwrap()),
+        );
+    }
+
     fn test_view_binding(
         base_expr: &str,
         expr: &str,
@@ -302,6 +370,17 @@ mod tests {
         );
     }
 
+    #[test]
+    fn test_py_signal_array_view_f64_bulk() {
+        test_view_binding(
+            "nengo.builder.signal.Signal(np.array([0., 1., 0., 2.]), name='BaseSignal')",
+            "s.SignalArrayViewF64.bulk(['a', 'view_signal'], [(slice(0, 1, 1),), (slice(1, 4, 2),)], [base_signal, base_signal])[1]",
+            "view_signal",
+            &[2],
+            ArrayRef::Owned(array![1., 2.].into_dimensionality::<IxDyn>().unwrap()),
+        );
+    }
+
     #[test]
     fn test_py_signal_u64() {
         test_binding::<_, ScalarSignal<u64>>("s.SignalU64('TestSignal', 2)", "TestSignal", &[], 2);
@@ -8,8 +8,8 @@ mod sync;
 use crate::binding::{
     engine::PyEngine,
     operator::{
-        PyCopy, PyDotInc, PyElementwiseInc, PyReset, PySimNeurons, PySimProcess, PySimPyFunc,
-        PyTimeUpdate,
+        PyCopy, PyDotInc, PyElementwiseInc, PyReset, PyResetBatch, PySimNeurons, PySimProcess,
+        PySimPyFunc, PyTimeUpdate,
     },
     probe::PyProbe,
     signal::{PySignalArrayF64, PySignalArrayViewF64, PySignalF64, PySignalU64},
@@ -24,6 +24,7 @@ fn nengo_rs(_py: Python, m: &PyModule) -> PyResult<()> {
     m.add_class::<PySignalF64>()?;
     m.add_class::<PySignalU64>()?;
     m.add_class::<PyReset>()?;
+    m.add_class::<PyResetBatch>()?;
     m.add_class::<PySimNeurons>()?;
     m.add_class::<PySimProcess>()?;
     m.add_class::<PySimPyFunc>()?;
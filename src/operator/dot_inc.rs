@@ -1,11 +1,27 @@
 use crate::operator::Operator;
-use crate::signal::{ArraySignal, SignalAccess};
+use crate::signal::{ArrayRef, ArraySignal, SignalAccess};
 use core::ops::AddAssign;
-use ndarray::LinalgScalar;
+use ndarray::linalg::general_mat_vec_mul;
+use ndarray::{Ix, Ix1, Ix2, LinalgScalar};
 use numpy::Element;
 use std::fmt::Debug;
 use std::sync::Arc;
 
+#[derive(Debug, Clone, Copy, PartialEq)]
+pub enum DotIncKernel {
+    MatVec,
+    Generic,
+}
+
+impl DotIncKernel {
+    pub fn for_shapes(target: &[Ix], left: &[Ix], right: &[Ix]) -> Self {
+        match (target, left, right) {
+            ([m], [left_m, n], [right_n]) if m == left_m && n == right_n => DotIncKernel::MatVec,
+            _ => DotIncKernel::Generic,
+        }
+    }
+}
+
 #[derive(Debug)]
 pub struct DotInc<T>
 where
@@ -14,6 +30,7 @@ where
     pub target: Arc<ArraySignal<T>>,
     pub left: Arc<ArraySignal<T>>,
     pub right: Arc<ArraySignal<T>>,
+    pub kernel: DotIncKernel,
 }
 
 impl<T> Operator for DotInc<T>
@@ -24,6 +41,20 @@ where
         let left = self.left.read();
         let right = self.right.read();
         let mut target = self.target.write();
+        if self.kernel == DotIncKernel::MatVec {
+            if let (ArrayRef::Owned(left), ArrayRef::Owned(right), ArrayRef::Owned(target)) =
+                (&**left, &**right, &mut **target)
+            {
+                general_mat_vec_mul(
+                    T::one(),
+                    &left.view().into_dimensionality::<Ix2>().unwrap(),
+                    &right.view().into_dimensionality::<Ix1>().unwrap(),
+                    T::one(),
+                    &mut target.view_mut().into_dimensionality::<Ix1>().unwrap(),
+                );
+                return;
+            }
+        }
         **target += &(**left).dot(&**right);
     }
 }
@@ -34,6 +65,7 @@ mod test {
     use crate::signal::Signal;
     use crate::venv::activate_venv;
     use ndarray::prelude::*;
+    use ndarray::{SliceInfo, SliceOrIndex};
     use numpy::IntoPyArray;
     use pyo3::Python;
     use std::error::Error;
@@ -56,6 +88,7 @@ mod test {
                 "right".to_string(),
                 array![6, 7].into_dyn().into_pyarray(py),
             )),
+            kernel: DotIncKernel::MatVec,
         };
         for signal in vec![&op.target, &op.left, &op.right].iter() {
             signal.reset();
@@ -85,6 +118,7 @@ mod test {
                 "right".to_string(),
                 array![6, 7].into_dyn().into_pyarray(py),
             )),
+            kernel: DotIncKernel::MatVec,
         };
         for signal in vec![&op.target, &op.left, &op.right].iter() {
             signal.reset();
@@ -95,4 +129,74 @@ mod test {
         assert_eq!(**op.target.read(), array![34, 60].into_dyn());
         Ok(())
     }
+
+    fn view(
+        name: &str,
+        base: &Arc<ArraySignal<u64>>,
+        start: isize,
+        end: isize,
+        step: isize,
+    ) -> Arc<ArraySignal<u64>> {
+        Arc::new(ArraySignal::new_view(
+            name.to_string(),
+            Arc::clone(base),
+            Box::new(
+                SliceInfo::new(vec![SliceOrIndex::Slice {
+                    start,
+                    end: Some(end),
+                    step,
+                }])
+                .unwrap(),
+            ),
+        ))
+    }
+
+    #[test]
+    fn it_falls_back_to_the_generic_product_for_views() -> Result<(), Box<dyn Error>> {
+        let gil = Python::acquire_gil();
+        let py = gil.python();
+        activate_venv(py);
+        let target_base = Arc::new(ArraySignal::new(
+            "target_base".to_string(),
+            Array::ones(IxDyn(&[3])).into_pyarray(py),
+        ));
+        let right_base = Arc::new(ArraySignal::new(
+            "right_base".to_string(),
+            array![0, 6, 0, 7].into_dyn().into_pyarray(py),
+        ));
+        target_base.reset();
+        right_base.reset();
+        let op = DotInc::<u64> {
+            target: view("target", &target_base, 1, 3, 1),
+            left: Arc::new(ArraySignal::new(
+                "left".to_string(),
+                array![[2, 3], [4, 5]].into_dyn().into_pyarray(py),
+            )),
+            right: view("right", &right_base, 1, 4, 2),
+            kernel: DotIncKernel::MatVec,
+        };
+        op.left.reset();
+
+        op.step();
+
+        assert_eq!(**op.target.read(), array![34, 60].into_dyn());
+        assert_eq!(**target_base.read(), array![1, 34, 60].into_dyn());
+        Ok(())
+    }
+
+    #[test]
+    fn it_selects_the_kernel_from_the_shapes() {
+        assert_eq!(
+            DotIncKernel::for_shapes(&[2], &[2, 3], &[3]),
+            DotIncKernel::MatVec
+        );
+        assert_eq!(
+            DotIncKernel::for_shapes(&[1], &[3], &[3]),
+            DotIncKernel::Generic
+        );
+        assert_eq!(
+            DotIncKernel::for_shapes(&[2], &[3, 2], &[3]),
+            DotIncKernel::Generic
+        );
+    }
 }
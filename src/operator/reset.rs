@@ -26,6 +26,25 @@ impl<T: Send + Sync + Copy + Debug + 'static> Operator for Reset<T, ScalarSignal
     }
 }
 
+#[derive(Debug)]
+pub struct ResetBatch<T, S>
+where
+    S: Signal,
+{
+    pub value: T,
+    pub targets: Vec<Arc<S>>,
+}
+
+impl<T: Element + Debug + Send + Sync + 'static> Operator
+    for ResetBatch<ArrayD<T>, ArraySignal<T>>
+{
+    fn step(&self) {
+        for target in self.targets.iter() {
+            target.write().assign_array(&self.value);
+        }
+    }
+}
+
 #[cfg(test)]
 mod test {
     use super::*;
@@ -69,4 +88,38 @@ mod test {
         );
         Ok(())
     }
+
+    #[test]
+    fn it_assigns_the_value_to_all_targets() -> Result<(), Box<dyn Error>> {
+        let gil = Python::acquire_gil();
+        let py = gil.python();
+        let op = ResetBatch::<ArrayD<u64>, ArraySignal<u64>> {
+            value: array![3].into_dimensionality::<IxDyn>()?,
+            targets: vec![
+                Arc::new(ArraySignal::new(
+                    "target1".to_string(),
+                    Array::zeros(IxDyn(&[2])).into_pyarray(py),
+                )),
+                Arc::new(ArraySignal::new(
+                    "target2".to_string(),
+                    Array::zeros(IxDyn(&[3])).into_pyarray(py),
+                )),
+            ],
+        };
+        for target in op.targets.iter() {
+            target.reset();
+        }
+
+        op.step();
+
+        assert_eq!(
+            **op.targets[0].read(),
+            array![3, 3].into_dimensionality::<IxDyn>()?
+        );
+        assert_eq!(
+            **op.targets[1].read(),
+            array![3, 3, 3].into_dimensionality::<IxDyn>()?
+        );
+        Ok(())
+    }
 }